@@ -0,0 +1,44 @@
+"""Warm the numba kernel cache ahead of time.
+
+numba removed its pycc AOT compiler, so kernels cannot be shipped as a
+prebuilt shared library any more. The njit kernels are declared with
+explicit signatures and cache=True instead, which persists the compiled
+machine code in __pycache__ after the first compilation. Running this
+module once (e.g. in a CI warm-up step or an image build) pays the
+compilation cost up front so test sessions and workers start with a hot
+cache. Without numba installed the kernels run as plain Python and
+there is nothing to build.
+
+Usage: python -m server.build_kernels
+"""
+
+import numpy as np
+
+from server.kernels import interval_velocity, njit, velocity_by_altitude
+
+
+def warm_kernel_cache() -> bool:
+    """Compile every kernel by calling it once with tiny inputs.
+
+    Returns: True if compiled kernels were warmed else False
+
+    """
+    if njit is None:
+        return False
+    tops = np.array([1.0, 0.0])
+    bottoms = np.array([0.0, -1.0])
+    vps = np.array([1000.0, 500.0])
+    inv_vps = 1 / vps
+    thickness = tops - bottoms
+    cum_thickness = np.concatenate(([0], np.cumsum(thickness)))
+    cum_time = np.concatenate(([0], np.cumsum(thickness * inv_vps)))
+    velocity_by_altitude(bottoms[::-1], vps[::-1], 0.5)
+    interval_velocity(
+        tops, bottoms, -tops, -bottoms, vps, inv_vps,
+        cum_thickness, cum_time, -0.5, 0.5,
+    )
+    return True
+
+
+if __name__ == '__main__':
+    warm_kernel_cache()
@@ -0,0 +1,208 @@
+"""Containers for velocity model description."""
+
+from dataclasses import dataclass, field
+from typing import Tuple
+
+from server.models import PyCoordinate, PyInterval, PyLayer, PyStation
+
+
+@dataclass(slots=True, frozen=True)
+class Interval:
+    """Closed altitude interval with validated limits.
+
+    Args:
+        min_val: bottom limit of interval
+        max_val: top limit of interval
+
+    Limits are validated in __post_init__; derived values (length,
+    middle, tuple_view) are computed once at construction and stored in
+    slots, so every read is a plain attribute load.
+    """
+
+    min_val: float
+    max_val: float
+    length: float = field(init=False, compare=False, repr=False)
+    middle: float = field(init=False, compare=False, repr=False)
+    tuple_view: Tuple[float, float] = field(
+        init=False, compare=False, repr=False,
+    )
+
+    def __post_init__(self):
+        """Validate limits and precompute derived interval values."""
+        if self.min_val > self.max_val:
+            raise ValueError('Invalid interval limits')
+        object.__setattr__(self, 'length', self.max_val - self.min_val)
+        object.__setattr__(self, 'middle', (self.min_val + self.max_val) / 2)
+        object.__setattr__(
+            self, 'tuple_view', (self.min_val, self.max_val),
+        )
+
+    @classmethod
+    def _unchecked(cls, min_val: float, max_val: float) -> 'Interval':
+        """Create interval without limits validation.
+
+        For internal callers whose limits are already known to be
+        ordered (e.g. values validated once at the API boundary);
+        skips the __post_init__ check on construction.
+
+        Args:
+            min_val: bottom limit of interval
+            max_val: top limit of interval
+
+        Returns: created interval
+
+        """
+        interval = cls.__new__(cls)
+        object.__setattr__(interval, 'min_val', min_val)
+        object.__setattr__(interval, 'max_val', max_val)
+        object.__setattr__(interval, 'length', max_val - min_val)
+        object.__setattr__(interval, 'middle', (min_val + max_val) / 2)
+        object.__setattr__(interval, 'tuple_view', (min_val, max_val))
+        return interval
+
+    @classmethod
+    def from_pymodel(cls, model: PyInterval) -> 'Interval':
+        """Create interval from already validated API model.
+
+        Args:
+            model: API interval model
+
+        Returns: created interval
+
+        """
+        return cls(min_val=model.min_val, max_val=model.max_val)
+
+
+@dataclass(slots=True, frozen=True)
+class Coordinate:
+    """Point coordinate in local coordinate system.
+
+    Args:
+        x: x coordinate value
+        y: y coordinate value
+        altitude: altitude value
+
+    """
+
+    x: float
+    y: float
+    altitude: float
+
+    @classmethod
+    def from_pymodel(cls, model: PyCoordinate) -> 'Coordinate':
+        """Create coordinate from already validated API model.
+
+        Args:
+            model: API coordinate model
+
+        Returns: created coordinate
+
+        """
+        return cls(x=model.x, y=model.y, altitude=model.altitude)
+
+    @property
+    def tuple_view(self) -> Tuple[float, float, float]:
+        """Return coordinate components as tuple.
+
+        Returns: tuple with x, y and altitude values
+
+        """
+        return self.x, self.y, self.altitude
+
+
+@dataclass(slots=True, frozen=True)
+class Station:
+    """Seismic station.
+
+    Args:
+        number: unique station number
+        coordinate: station coordinate
+
+    """
+
+    number: int
+    coordinate: Coordinate
+
+    @classmethod
+    def from_pymodel(cls, model: PyStation) -> 'Station':
+        """Create station from already validated API model.
+
+        The coordinate conversion is inlined with positional arguments:
+        one constructor expression per station instead of a nested
+        classmethod call with keyword dispatch, which matters when
+        ingesting thousands of stations.
+
+        Args:
+            model: API station model
+
+        Returns: created station
+
+        """
+        coordinate = model.coordinate
+        return cls(
+            model.number,
+            Coordinate(coordinate.x, coordinate.y, coordinate.altitude),
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class Correction:
+    """Static correction for a station.
+
+    Args:
+        station_number: unique station number
+        time_value: vertical travel time from base altitude to station
+
+    """
+
+    station_number: int
+    time_value: float
+
+
+@dataclass(slots=True, frozen=True)
+class Layer:
+    """Velocity model layer.
+
+    Args:
+        altitude_interval: altitude limits of layer
+        vp: velocity of compressional wave
+
+    """
+
+    altitude_interval: Interval
+    vp: float
+    thickness: float = field(init=False, compare=False)
+    middle_altitude: float = field(init=False, compare=False)
+    travel_time: float = field(init=False, compare=False)
+
+    def __post_init__(self):
+        """Precompute derived layer values.
+
+        Thickness, middle altitude and vertical travel time are fixed
+        for an immutable interval, so they are computed once here
+        instead of on every property access.
+        """
+        object.__setattr__(self, 'thickness', self.altitude_interval.length)
+        object.__setattr__(
+            self, 'middle_altitude', self.altitude_interval.middle,
+        )
+        object.__setattr__(self, 'travel_time', self.thickness / self.vp)
+
+    @classmethod
+    def from_pymodel(cls, model: PyLayer) -> 'Layer':
+        """Create layer from already validated API model.
+
+        Args:
+            model: API layer model
+
+        The interval conversion is inlined with positional arguments,
+        mirroring Station.from_pymodel.
+
+        Returns: created layer
+
+        """
+        altitude_interval = model.altitude_interval
+        return cls(
+            Interval(altitude_interval.min_val, altitude_interval.max_val),
+            model.vp,
+        )
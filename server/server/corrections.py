@@ -0,0 +1,60 @@
+"""Static corrections computation."""
+
+from typing import Tuple
+
+import numpy as np
+
+from server.containers import Correction
+from server.observation_system import ObservationSystem
+from server.velocity_model import VelocityModel
+
+
+class StaticCorrection:
+    """Vertical static corrections for observation system stations.
+
+    Observation system, model and computed corrections never change
+    after construction, so they are exposed as plain attributes set
+    once in __init__ instead of property getters.
+    """
+
+    def __init__(
+        self, observation_system: ObservationSystem, model: VelocityModel,
+    ):
+        """Create static correction for observation system.
+
+        Args:
+            observation_system: stations to correct
+            model: velocity model covering station altitudes
+
+        """
+        self.observation_system = observation_system
+        self.model = model
+        self.corrections = self.__get_corrections()
+
+    def __get_corrections(self) -> Tuple[Correction, ...]:
+        """Compute corrections for all stations in one vectorized pass.
+
+        Per-layer thicknesses between the base altitude and every
+        station altitude are computed over a (stations, layers) tile and
+        reduced to travel times with a single matrix-vector product.
+
+        Returns: corrections tuple in station order
+
+        """
+        model = self.model
+        altitudes = self.observation_system.altitudes
+        base_altitude = self.observation_system.base_altitude
+        is_bad_base = base_altitude < model.min_altitude
+        is_bad_tops = altitudes.max() > model.max_altitude
+        if is_bad_base or is_bad_tops:
+            raise ValueError('Station altitudes out of model limits')
+        limited_tops = np.minimum(model._tops[None, :], altitudes[:, None])
+        limited_bottoms = np.maximum(model._bottoms[None, :], base_altitude)
+        thickness = np.maximum(0, limited_tops - limited_bottoms)
+        time_values = thickness @ model._inv_vps
+        return tuple(
+            Correction(station_number=station.number, time_value=time_value)
+            for station, time_value in zip(
+                self.observation_system.stations, time_values.tolist(),
+            )
+        )
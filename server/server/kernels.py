@@ -0,0 +1,89 @@
+"""Computation kernels for velocity model queries.
+
+Kernels are compiled to native code with numba when it is available;
+otherwise the same functions run as plain Python over NumPy arrays.
+Signatures are passed to njit explicitly so compilation happens at
+import time and is reused from the on-disk cache across sessions.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _velocity_by_altitude(
+    bottoms_asc: np.ndarray, vps_asc: np.ndarray, altitude: float,
+) -> float:
+    """Return layer velocity at already validated altitude.
+
+    Args:
+        bottoms_asc: layer bottom altitudes sorted in ascending order
+        vps_asc: layer velocities in the same order
+        altitude: altitude value inside model limits
+
+    Returns: velocity value of containing layer
+
+    """
+    index = np.searchsorted(bottoms_asc, altitude, side='right')
+    return vps_asc[index - 1]
+
+
+def _interval_velocity(
+    tops: np.ndarray, bottoms: np.ndarray,
+    neg_tops: np.ndarray, neg_bottoms: np.ndarray,
+    vps: np.ndarray, inv_vps: np.ndarray,
+    cum_thickness: np.ndarray, cum_time: np.ndarray,
+    min_altitude: float, max_altitude: float,
+) -> float:
+    """Return average velocity in already validated altitude interval.
+
+    Two binary searches locate the end layers; their partial thickness
+    contributions are computed analytically and fully covered layers in
+    between come from the cumulative prefix arrays.
+
+    Args:
+        tops: layer top altitudes sorted in descending order
+        bottoms: layer bottom altitudes sorted in descending order
+        neg_tops: negated tops array (ascending for searchsorted)
+        neg_bottoms: negated bottoms array (ascending for searchsorted)
+        vps: layer velocities in the same order
+        inv_vps: reciprocal layer velocities in the same order
+        cum_thickness: thickness prefix sums with leading zero
+        cum_time: travel-time prefix sums with leading zero
+        min_altitude: bottom limit of query interval
+        max_altitude: top limit of query interval
+
+    Returns: thickness-weighted average velocity value
+
+    """
+    top = np.searchsorted(neg_bottoms, -max_altitude, side='right')
+    bottom = np.searchsorted(neg_tops, -min_altitude, side='left') - 1
+    if top == bottom:
+        return vps[top]
+    top_thickness = max_altitude - bottoms[top]
+    bottom_thickness = tops[bottom] - min_altitude
+    middle_thickness = cum_thickness[bottom] - cum_thickness[top + 1]
+    total_thickness = top_thickness + bottom_thickness + middle_thickness
+    top_time = top_thickness * inv_vps[top]
+    bottom_time = bottom_thickness * inv_vps[bottom]
+    middle_time = cum_time[bottom] - cum_time[top + 1]
+    total_time = top_time + bottom_time + middle_time
+    return total_thickness / total_time
+
+
+if njit is not None:
+    velocity_by_altitude = njit(
+        'float64(float64[:], float64[:], float64)',
+        cache=True,
+    )(_velocity_by_altitude)
+    interval_velocity = njit(
+        'float64(float64[:], float64[:], float64[:], float64[:], '
+        'float64[:], float64[:], float64[:], float64[:], float64, float64)',
+        cache=True,
+    )(_interval_velocity)
+else:
+    velocity_by_altitude = _velocity_by_altitude
+    interval_velocity = _interval_velocity
@@ -0,0 +1,53 @@
+"""Msgspec models for API input and output.
+
+Models are msgspec structs: typed JSON decoding with
+msgspec.json.decode(raw, type=...) validates field names and types an
+order of magnitude faster than pydantic on nested payloads such as
+observation systems with many stations. Structs are frozen and reject
+unknown fields, so malformed payloads fail at the API boundary.
+"""
+
+from typing import List
+
+from msgspec import Struct
+
+
+class PyCoordinate(Struct, frozen=True, forbid_unknown_fields=True):
+    """Point coordinate in local coordinate system."""
+
+    x: float
+    y: float
+    altitude: float
+
+
+class PyStation(Struct, frozen=True, forbid_unknown_fields=True):
+    """Seismic station."""
+
+    number: int
+    coordinate: PyCoordinate
+
+
+class PyObservationSystem(Struct, frozen=True, forbid_unknown_fields=True):
+    """Set of seismic stations."""
+
+    stations: List[PyStation]
+
+
+class PyInterval(Struct, frozen=True, forbid_unknown_fields=True):
+    """Closed altitude interval."""
+
+    min_val: float
+    max_val: float
+
+
+class PyLayer(Struct, frozen=True, forbid_unknown_fields=True):
+    """Velocity model layer."""
+
+    altitude_interval: PyInterval
+    vp: float
+
+
+class PyVelocityModel(Struct, frozen=True, forbid_unknown_fields=True):
+    """Layered velocity model."""
+
+    layers: List[PyLayer]
@@ -0,0 +1,127 @@
+"""Observation system description."""
+
+from typing import List
+
+import numpy as np
+
+from server.containers import Station
+from server.models import PyObservationSystem
+
+
+class ObservationSystem:
+    """Set of seismic stations.
+
+    Station data is additionally stored as SoA arrays — an int64 numbers
+    array and three float64 component arrays — so reductions and
+    comparisons run over contiguous memory instead of chasing Station
+    and Coordinate objects.
+    """
+
+    def __init__(self, stations: List[Station]):
+        """Create observation system from stations list.
+
+        Args:
+            stations: list of stations
+
+        """
+        if not stations:
+            raise ValueError('Empty stations list')
+        self._stations = stations
+        self._stations_count = len(stations)
+        stations_count = self._stations_count
+        self._numbers = np.fromiter(
+            (x.number for x in stations),
+            dtype=np.int64, count=stations_count,
+        )
+        self._xs = np.fromiter(
+            (x.coordinate.x for x in stations),
+            dtype=np.float64, count=stations_count,
+        )
+        self._ys = np.fromiter(
+            (x.coordinate.y for x in stations),
+            dtype=np.float64, count=stations_count,
+        )
+        self._alts = np.fromiter(
+            (x.coordinate.altitude for x in stations),
+            dtype=np.float64, count=stations_count,
+        )
+        self._base_altitude = float(self._alts.min())
+
+    @classmethod
+    def from_pymodel(cls, model: PyObservationSystem) -> 'ObservationSystem':
+        """Create observation system from already validated API model.
+
+        Args:
+            model: API observation system model
+
+        Returns: created observation system
+
+        """
+        return cls(
+            stations=[Station.from_pymodel(model=x) for x in model.stations],
+        )
+
+    @property
+    def stations(self) -> List[Station]:
+        """Return stations.
+
+        Returns: stations list in original order
+
+        """
+        return self._stations
+
+    @property
+    def altitudes(self) -> np.ndarray:
+        """Return station altitudes as float64 array.
+
+        Returns: altitudes array in station order
+
+        """
+        return self._alts
+
+    @property
+    def base_altitude(self) -> float:
+        """Return minimal station altitude.
+
+        Returns: minimal altitude value
+
+        """
+        return self._base_altitude
+
+    @property
+    def stations_count(self) -> int:
+        """Return number of stations.
+
+        Returns: stations count
+
+        """
+        return self._stations_count
+
+    def __eq__(self, other: object) -> bool:
+        """Compare observation systems by stations.
+
+        Comparison runs over the SoA arrays with np.array_equal calls
+        instead of comparing Station objects one by one.
+
+        Args:
+            other: observation system for comparison
+
+        Returns: True if stations are equal else False
+
+        """
+        if not isinstance(other, ObservationSystem):
+            return NotImplemented
+        return all((
+            np.array_equal(self._numbers, other._numbers),
+            np.array_equal(self._xs, other._xs),
+            np.array_equal(self._ys, other._ys),
+            np.array_equal(self._alts, other._alts),
+        ))
+
+    def __repr__(self) -> str:
+        """Return observation system representation.
+
+        Returns: representation string
+
+        """
+        return f'ObservationSystem(stations_count={self._stations_count})'
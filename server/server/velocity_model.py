@@ -0,0 +1,360 @@
+"""Seismic velocity model."""
+
+from functools import lru_cache
+from typing import List, Tuple
+
+import numpy as np
+
+from server.containers import Interval, Layer
+from server.kernels import interval_velocity, velocity_by_altitude
+from server.models import PyVelocityModel
+
+
+class VelocityModel:
+    """Layered velocity model sorted from top to bottom."""
+
+    def __init__(self, layers: List[Layer], assume_sorted: bool = False):
+        """Create model from layers list.
+
+        Layers are stored sorted by top altitude in descending order;
+        input already in that order is detected with one vectorized
+        comparison and kept as is without the argsort pass.
+        Layer limits and velocities are additionally kept as parallel
+        float64 arrays to run interval queries as vectorized operations
+        instead of per-layer Python iteration.
+
+        Args:
+            layers: list of model layers
+            assume_sorted: skip the order check for layers the caller
+                already verified to be sorted top-first
+
+        """
+        if not layers:
+            raise ValueError('Empty layers list')
+        layers_count = len(layers)
+        max_vals = np.fromiter(
+            (x.altitude_interval.max_val for x in layers),
+            dtype=np.float64, count=layers_count,
+        )
+        if assume_sorted or bool((max_vals[:-1] > max_vals[1:]).all()):
+            self._tops = max_vals
+        else:
+            order = np.argsort(-max_vals)
+            layers = [layers[i] for i in order]
+            self._tops = max_vals[order]
+        self._layers = tuple(layers)
+        self._bottoms = np.fromiter(
+            (x.altitude_interval.min_val for x in layers),
+            dtype=np.float64, count=layers_count,
+        )
+        self._vps = np.fromiter(
+            (x.vp for x in layers), dtype=np.float64, count=layers_count,
+        )
+        self._build_derived_arrays()
+
+    def _build_derived_arrays(self):
+        """Precompute query arrays from the tops/bottoms/vps arrays."""
+        self._inv_vps = 1 / self._vps
+        self._bottoms_asc = self._bottoms[::-1]
+        self._vps_asc = self._vps[::-1]
+        self._neg_tops = -self._tops
+        self._neg_bottoms = -self._bottoms
+        thickness = self._tops - self._bottoms
+        self._cum_thickness = np.concatenate(([0], np.cumsum(thickness)))
+        self._cum_time = np.concatenate(
+            ([0], np.cumsum(thickness * self._inv_vps)),
+        )
+        self._min_altitude = float(self._bottoms[-1])
+        self._max_altitude = float(self._tops[0])
+        self._hash = hash(
+            (
+                self._tops.tobytes(),
+                self._bottoms.tobytes(),
+                self._vps.tobytes(),
+            ),
+        )
+
+    @classmethod
+    def _from_arrays(
+        cls, tops: np.ndarray, bottoms: np.ndarray, vps: np.ndarray,
+    ) -> 'VelocityModel':
+        """Create model directly from sorted layer limit arrays.
+
+        Skips Layer object construction entirely; the layers tuple is
+        rebuilt lazily from the arrays only if something asks for it.
+
+        Args:
+            tops: layer top altitudes sorted in descending order
+            bottoms: layer bottom altitudes in the same order
+            vps: layer velocities in the same order
+
+        Returns: created velocity model
+
+        """
+        model = cls.__new__(cls)
+        model._layers = None
+        model._tops = tops
+        model._bottoms = bottoms
+        model._vps = vps
+        model._build_derived_arrays()
+        return model
+
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _cached_build(layers: Tuple[Layer, ...]) -> 'VelocityModel':
+        """Return model built from layers, memoized by layer tuple.
+
+        Construction is pure, so repeated builds from the same layers
+        (e.g. across tests) hit the cache instead of re-sorting and
+        re-allocating the limit arrays.
+
+        Args:
+            layers: tuple of model layers
+
+        Returns: built model
+
+        """
+        return VelocityModel(layers=list(layers))
+
+    @classmethod
+    def from_pymodel(cls, model: PyVelocityModel) -> 'VelocityModel':
+        """Create velocity model from already validated API model.
+
+        The API layers are converted straight into the limit arrays
+        with np.fromiter passes — no intermediate Layer or Interval
+        objects are built for the common ingestion path.
+
+        Args:
+            model: API velocity model
+
+        Returns: created velocity model
+
+        """
+        py_layers = model.layers
+        if not py_layers:
+            raise ValueError('Empty layers list')
+        layers_count = len(py_layers)
+        tops = np.fromiter(
+            (x.altitude_interval.max_val for x in py_layers),
+            dtype=np.float64, count=layers_count,
+        )
+        bottoms = np.fromiter(
+            (x.altitude_interval.min_val for x in py_layers),
+            dtype=np.float64, count=layers_count,
+        )
+        vps = np.fromiter(
+            (x.vp for x in py_layers), dtype=np.float64, count=layers_count,
+        )
+        if not bool((tops[:-1] > tops[1:]).all()):
+            order = np.argsort(-tops)
+            tops = tops[order]
+            bottoms = bottoms[order]
+            vps = vps[order]
+        return cls._from_arrays(tops=tops, bottoms=bottoms, vps=vps)
+
+    @property
+    def layers(self) -> Tuple[Layer, ...]:
+        """Return model layers.
+
+        For models built from arrays the tuple is materialized on first
+        access from the stored limits, which are already validated.
+
+        Returns: layers tuple sorted by top altitude in descending order
+
+        """
+        if self._layers is None:
+            self._layers = tuple(
+                Layer(
+                    altitude_interval=Interval._unchecked(bottom, top),
+                    vp=vp,
+                )
+                for top, bottom, vp in zip(
+                    self._tops.tolist(),
+                    self._bottoms.tolist(),
+                    self._vps.tolist(),
+                )
+            )
+        return self._layers
+
+    @property
+    def min_altitude(self) -> float:
+        """Return bottom altitude of model.
+
+        Returns: minimal altitude value
+
+        """
+        return self._min_altitude
+
+    @property
+    def max_altitude(self) -> float:
+        """Return top altitude of model.
+
+        Returns: maximal altitude value
+
+        """
+        return self._max_altitude
+
+    def get_velocity_by_altitude(self, altitude: float) -> float:
+        """Return layer velocity at altitude.
+
+        Because layers are contiguous and sorted, the containing layer
+        is found with one binary search over the ascending layer
+        bottoms array in the velocity_by_altitude kernel; a boundary
+        altitude resolves to the upper layer without extra branching.
+
+        Args:
+            altitude: altitude value
+
+        Returns: velocity value of containing layer
+
+        """
+        if not self._min_altitude <= altitude <= self._max_altitude:
+            raise ValueError('Altitude out of model altitude limits')
+        return float(
+            velocity_by_altitude(self._bottoms_asc, self._vps_asc, altitude),
+        )
+
+    def get_interval_velocity(self, altitude_interval: Interval) -> float:
+        """Return average velocity in altitude interval.
+
+        The velocity is the total thickness inside the interval divided
+        by the total travel time, computed over the precomputed layer
+        arrays.
+
+        Args:
+            altitude_interval: altitude limits of query
+
+        Returns: thickness-weighted average velocity value
+
+        """
+        min_altitude, max_altitude = altitude_interval.tuple_view
+        is_below = min_altitude < self._min_altitude
+        is_above = max_altitude > self._max_altitude
+        if is_below or is_above:
+            raise ValueError('Interval out of model altitude limits')
+        if min_altitude == max_altitude:
+            return self.get_velocity_by_altitude(altitude=min_altitude)
+        return self._interval_velocity_cached(min_altitude, max_altitude)
+
+    @lru_cache(maxsize=1024)
+    def _interval_velocity_cached(
+        self, min_altitude: float, max_altitude: float,
+    ) -> float:
+        """Return memoized average velocity for validated interval limits.
+
+        Stations frequently share altitudes (e.g. deployed on the same
+        bench), so repeated queries with identical limits hit an O(1)
+        lookup instead of re-running the kernel.
+
+        Args:
+            min_altitude: bottom limit of query interval
+            max_altitude: top limit of query interval
+
+        Returns: thickness-weighted average velocity value
+
+        """
+        return self._interval_velocity_unchecked(
+            min_altitude=min_altitude, max_altitude=max_altitude,
+        )
+
+    def _interval_velocity_unchecked(
+        self, min_altitude: float, max_altitude: float,
+    ) -> float:
+        """Return average velocity for an already validated interval.
+
+        Skips bounds and zero-length checks; callers that validated the
+        limits once (e.g. batched workloads) can use this directly. The
+        work happens in the interval_velocity kernel over the
+        precomputed layer and prefix arrays, so the query cost is
+        O(log N) regardless of how many layers the interval spans.
+
+        Args:
+            min_altitude: bottom limit of query interval
+            max_altitude: top limit of query interval
+
+        Returns: thickness-weighted average velocity value
+
+        """
+        return float(
+            interval_velocity(
+                self._tops, self._bottoms,
+                self._neg_tops, self._neg_bottoms,
+                self._vps, self._inv_vps,
+                self._cum_thickness, self._cum_time,
+                min_altitude, max_altitude,
+            ),
+        )
+
+    def get_interval_velocities(
+        self, min_altitudes: np.ndarray, max_altitudes: np.ndarray,
+    ) -> np.ndarray:
+        """Return average velocities for a batch of altitude intervals.
+
+        Thicknesses are computed branchless for all queries at once over
+        a (queries, layers) tile; travel times are fused into a single
+        einsum reduction. Intervals must have non-zero length, use
+        get_velocity_by_altitude for point queries.
+
+        Args:
+            min_altitudes: bottom limits of query intervals
+            max_altitudes: top limits of query intervals
+
+        Returns: array of thickness-weighted average velocity values
+
+        """
+        min_altitudes = np.asarray(min_altitudes, dtype=np.float64)
+        max_altitudes = np.asarray(max_altitudes, dtype=np.float64)
+        is_below = min_altitudes.min() < self._min_altitude
+        is_above = max_altitudes.max() > self._max_altitude
+        is_inverted = bool((min_altitudes >= max_altitudes).any())
+        if is_below or is_above or is_inverted:
+            raise ValueError('Interval out of model altitude limits')
+        limited_tops = np.minimum(
+            self._tops[None, :], max_altitudes[:, None],
+        )
+        limited_bottoms = np.maximum(
+            self._bottoms[None, :], min_altitudes[:, None],
+        )
+        thickness = np.maximum(0, limited_tops - limited_bottoms)
+        travel_times = np.einsum('qn,n->q', thickness, self._inv_vps)
+        return thickness.sum(axis=1) / travel_times
+
+    def __eq__(self, other: object) -> bool:
+        """Compare velocity models by layers.
+
+        Comparison runs over the sorted limit arrays with np.array_equal
+        calls instead of comparing Layer objects one by one.
+
+        Args:
+            other: velocity model for comparison
+
+        Returns: True if layers are equal else False
+
+        """
+        if not isinstance(other, VelocityModel):
+            return NotImplemented
+        return all((
+            np.array_equal(self._tops, other._tops),
+            np.array_equal(self._bottoms, other._bottoms),
+            np.array_equal(self._vps, other._vps),
+        ))
+
+    def __hash__(self) -> int:
+        """Return hash of layer limit arrays.
+
+        The hash is computed once over the array bytes at construction;
+        the interval-velocity memo cache hashes the model on every
+        lookup, so this read must stay O(1).
+
+        Returns: hash value
+
+        """
+        return self._hash
+
+    def __repr__(self) -> str:
+        """Return velocity model representation.
+
+        Returns: representation string
+
+        """
+        return f'VelocityModel(layers_count={self._tops.shape[0]})'
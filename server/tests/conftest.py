@@ -0,0 +1,32 @@
+import pytest
+
+from server.observation_system import ObservationSystem
+from server.velocity_model import VelocityModel
+from tests.helpers import generate_layers, generate_stations
+
+
+@pytest.fixture(scope='session')
+def random_layers():
+    return generate_layers()
+
+
+@pytest.fixture(scope='session')
+def random_model(random_layers):
+    return VelocityModel._cached_build(tuple(random_layers))
+
+
+@pytest.fixture(scope='session')
+def model_bundle(random_layers, random_model):
+    min_altitude = random_layers[-1].altitude_interval.min_val
+    max_altitude = random_layers[0].altitude_interval.max_val
+    return random_layers, random_model, min_altitude, max_altitude
+
+
+@pytest.fixture(scope='session')
+def random_stations():
+    return generate_stations()
+
+
+@pytest.fixture(scope='session')
+def random_observation_system(random_stations):
+    return ObservationSystem(stations=random_stations)
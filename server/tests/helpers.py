@@ -0,0 +1,52 @@
+from typing import List
+
+import numpy as np
+
+from server.containers import Coordinate, Interval, Layer, Station
+
+MIN_MODEL_ALTITUDE, MAX_MODEL_ALTITUDE = -2000, 200
+MIN_VP, MAX_VP = 100, 2000
+GENERATION_SIZE = 100
+MIN_COORDINATE, MAX_COORDINATE = -1000, 1000
+MIN_STATION_ALTITUDE, MAX_STATION_ALTITUDE = -100, 200
+MAX_STATIONS_COUNT = 100
+RNG_SEED = 0
+
+rng = np.random.default_rng(RNG_SEED)
+
+
+def generate_layers() -> List[Layer]:
+    altitudes = np.unique(
+        rng.integers(
+            MIN_MODEL_ALTITUDE, MAX_MODEL_ALTITUDE + 1,
+            size=GENERATION_SIZE,
+        ),
+    )[::-1].tolist()
+    vps = rng.integers(MIN_VP, MAX_VP + 1, size=len(altitudes) - 1).tolist()
+    return [
+        Layer(altitude_interval=Interval(min_val=bottom, max_val=top), vp=vp)
+        for top, bottom, vp in zip(altitudes, altitudes[1:], vps)
+    ]
+
+
+def generate_stations(
+    min_altitude: int = MIN_STATION_ALTITUDE,
+    max_altitude: int = MAX_STATION_ALTITUDE,
+) -> List[Station]:
+    stations_count = int(rng.integers(1, MAX_STATIONS_COUNT + 1))
+    xs = rng.integers(
+        MIN_COORDINATE, MAX_COORDINATE + 1, size=stations_count,
+    ).tolist()
+    ys = rng.integers(
+        MIN_COORDINATE, MAX_COORDINATE + 1, size=stations_count,
+    ).tolist()
+    altitudes = rng.integers(
+        min_altitude, max_altitude + 1, size=stations_count,
+    ).tolist()
+    return [
+        Station(
+            number=i + 1,
+            coordinate=Coordinate(x=xs[i], y=ys[i], altitude=altitudes[i]),
+        )
+        for i in range(stations_count)
+    ]
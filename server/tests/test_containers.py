@@ -0,0 +1,96 @@
+from random import Random
+
+import pytest
+
+from server.containers import Coordinate, Interval, Layer, Station
+from server.models import (
+    PyCoordinate,
+    PyInterval,
+    PyLayer,
+    PyStation,
+)
+
+_rng = Random(0)
+INTERVAL_LIMITS = [
+    tuple(sorted((_rng.randint(-100, 100), _rng.randint(-100, 100))))
+    for _ in range(16)
+]
+
+
+class TestInterval:
+    def test_invalid_input(self):
+        with pytest.raises(ValueError):
+            Interval(min_val=100, max_val=-100)
+
+    @pytest.mark.parametrize('min_val, max_val', INTERVAL_LIMITS)
+    def test_tuple_view(self, min_val, max_val):
+        interval = Interval(min_val=min_val, max_val=max_val)
+        assert interval.tuple_view == (min_val, max_val)
+
+    @pytest.mark.parametrize('min_val, max_val', INTERVAL_LIMITS)
+    def test_length(self, min_val, max_val):
+        interval = Interval(min_val=min_val, max_val=max_val)
+        assert interval.length == max_val - min_val
+
+    @pytest.mark.parametrize('min_val, max_val', INTERVAL_LIMITS)
+    def test_middle(self, min_val, max_val):
+        interval = Interval(min_val=min_val, max_val=max_val)
+        assert interval.middle == (min_val + max_val) / 2
+
+    def test_from_pymodel(self):
+        py_interval = PyInterval(min_val=-100, max_val=50)
+        interval = Interval.from_pymodel(model=py_interval)
+        assert interval == Interval(min_val=-100, max_val=50)
+
+
+class TestCoordinate:
+    def test_tuple_view(self):
+        coordinate = Coordinate(x=10, y=-20, altitude=30)
+        assert coordinate.tuple_view == (10, -20, 30)
+
+    def test_from_pymodel(self):
+        py_coordinate = PyCoordinate(x=10, y=-20, altitude=30)
+        coordinate = Coordinate.from_pymodel(model=py_coordinate)
+        assert coordinate == Coordinate(x=10, y=-20, altitude=30)
+
+
+class TestStation:
+    def test_from_pymodel(self):
+        py_station = PyStation(
+            number=1,
+            coordinate=PyCoordinate(x=10, y=-20, altitude=30),
+        )
+        station = Station.from_pymodel(model=py_station)
+        assert station == Station(
+            number=1, coordinate=Coordinate(x=10, y=-20, altitude=30),
+        )
+
+
+class TestLayer:
+    def test_thickness(self):
+        layer = Layer(
+            altitude_interval=Interval(min_val=-100, max_val=50), vp=1500,
+        )
+        assert layer.thickness == 150
+
+    def test_middle_altitude(self):
+        layer = Layer(
+            altitude_interval=Interval(min_val=-100, max_val=50), vp=1500,
+        )
+        assert layer.middle_altitude == -25
+
+    def test_travel_time(self):
+        layer = Layer(
+            altitude_interval=Interval(min_val=-100, max_val=50), vp=1500,
+        )
+        assert layer.travel_time == 150 / 1500
+
+    def test_from_pymodel(self):
+        py_layer = PyLayer(
+            altitude_interval=PyInterval(min_val=-100, max_val=50),
+            vp=1500,
+        )
+        layer = Layer.from_pymodel(model=py_layer)
+        assert layer == Layer(
+            altitude_interval=Interval(min_val=-100, max_val=50), vp=1500,
+        )
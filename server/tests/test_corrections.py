@@ -0,0 +1,81 @@
+import pytest
+
+from server.containers import Coordinate, Interval, Layer, Station
+from server.corrections import StaticCorrection
+from server.observation_system import ObservationSystem
+from server.velocity_model import VelocityModel
+from tests.helpers import generate_stations
+
+
+class TestStaticCorrection:
+    def test_correction_is_travel_time(self):
+        model = VelocityModel(
+            layers=[
+                Layer(
+                    altitude_interval=Interval(min_val=0, max_val=100),
+                    vp=1000,
+                ),
+                Layer(
+                    altitude_interval=Interval(min_val=-100, max_val=0),
+                    vp=500,
+                ),
+            ],
+        )
+        observation_system = ObservationSystem(
+            stations=[
+                Station(
+                    number=1,
+                    coordinate=Coordinate(x=0, y=0, altitude=-100),
+                ),
+                Station(
+                    number=2,
+                    coordinate=Coordinate(x=0, y=0, altitude=100),
+                ),
+            ],
+        )
+        static_correction = StaticCorrection(
+            observation_system=observation_system, model=model,
+        )
+        base_correction, top_correction = static_correction.corrections
+        assert base_correction.time_value == 0
+        assert top_correction.time_value == pytest.approx(
+            100 / 500 + 100 / 1000,
+        )
+
+    def test_corrections(self, random_model):
+        stations = generate_stations(
+            min_altitude=int(random_model.min_altitude),
+            max_altitude=int(random_model.max_altitude),
+        )
+        observation_system = ObservationSystem(stations=stations)
+        static_correction = StaticCorrection(
+            observation_system=observation_system, model=random_model,
+        )
+        base_altitude = observation_system.base_altitude
+        for correction, station in zip(
+            static_correction.corrections, stations,
+        ):
+            assert correction.station_number == station.number
+            interval = Interval(
+                min_val=base_altitude,
+                max_val=station.coordinate.altitude,
+            )
+            if interval.length == 0:
+                expected_time = 0
+            else:
+                velocity_value = random_model.get_interval_velocity(
+                    altitude_interval=interval,
+                )
+                expected_time = interval.length / velocity_value
+            assert correction.time_value == pytest.approx(expected_time)
+
+    def test_bad_station_altitudes(self, random_model):
+        stations = generate_stations(
+            min_altitude=int(random_model.max_altitude) + 100,
+            max_altitude=int(random_model.max_altitude) + 200,
+        )
+        observation_system = ObservationSystem(stations=stations)
+        with pytest.raises(ValueError):
+            StaticCorrection(
+                observation_system=observation_system, model=random_model,
+            )
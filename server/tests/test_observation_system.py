@@ -0,0 +1,33 @@
+import pytest
+
+from server.models import PyCoordinate, PyObservationSystem, PyStation
+from server.observation_system import ObservationSystem
+
+
+class TestObservationSystem:
+    def test_empty_stations_list(self):
+        with pytest.raises(ValueError):
+            ObservationSystem(stations=[])
+
+    def test_from_pymodel(self, random_stations, random_observation_system):
+        py_stations = [
+            PyStation(
+                number=number,
+                coordinate=PyCoordinate(x=x, y=y, altitude=altitude),
+            )
+            for number, x, y, altitude in zip(
+                random_observation_system._numbers.tolist(),
+                random_observation_system._xs.tolist(),
+                random_observation_system._ys.tolist(),
+                random_observation_system._alts.tolist(),
+            )
+        ]
+        py_observation_system = PyObservationSystem(stations=py_stations)
+        observation_system = ObservationSystem.from_pymodel(
+            model=py_observation_system,
+        )
+        assert observation_system == random_observation_system
+
+    def test_base_altitude(self, random_stations, random_observation_system):
+        min_altitude = min((x.coordinate.altitude for x in random_stations))
+        assert random_observation_system.base_altitude == min_altitude
@@ -0,0 +1,148 @@
+import numpy as np
+import pytest
+
+from server.containers import Interval
+from server.models import PyInterval, PyLayer, PyVelocityModel
+from server.velocity_model import VelocityModel
+
+
+def _middle_middle_corners(top_layer, bottom_layer):
+    return (
+        bottom_layer.middle_altitude, top_layer.middle_altitude,
+        top_layer.thickness / 2, bottom_layer.thickness / 2,
+    )
+
+
+def _top_middle_corners(top_layer, bottom_layer):
+    return (
+        bottom_layer.middle_altitude, top_layer.altitude_interval.max_val,
+        top_layer.thickness, bottom_layer.thickness / 2,
+    )
+
+
+def _middle_bottom_corners(top_layer, bottom_layer):
+    return (
+        bottom_layer.altitude_interval.min_val, top_layer.middle_altitude,
+        top_layer.thickness / 2, bottom_layer.thickness,
+    )
+
+
+def _top_bottom_corners(top_layer, bottom_layer):
+    return (
+        bottom_layer.altitude_interval.min_val,
+        top_layer.altitude_interval.max_val,
+        top_layer.thickness, bottom_layer.thickness,
+    )
+
+
+class TestModel:
+    def test_layers(self, random_model):
+        layers = random_model.layers
+        for top_layer, bottom_layer in zip(layers, layers[1:]):
+            assert top_layer.altitude_interval.min_val == (
+                bottom_layer.altitude_interval.max_val
+            )
+
+    def test_empty_layers_list(self):
+        with pytest.raises(ValueError):
+            VelocityModel(layers=[])
+
+    def test_from_pymodel(self, random_layers):
+        py_layers = [
+            PyLayer(
+                altitude_interval=PyInterval(
+                    min_val=layer.altitude_interval.min_val,
+                    max_val=layer.altitude_interval.max_val,
+                ),
+                vp=layer.vp,
+            )
+            for layer in random_layers
+        ]
+        py_model = PyVelocityModel(layers=py_layers)
+        model = VelocityModel.from_pymodel(model=py_model)
+        assert list(model.layers) == sorted(
+            random_layers,
+            key=lambda x: x.altitude_interval.max_val,
+            reverse=True,
+        )
+
+    def test_altitude_limits(self, model_bundle):
+        _, model, min_altitude, max_altitude = model_bundle
+        assert model.min_altitude == min_altitude
+        assert model.max_altitude == max_altitude
+
+    def test_get_velocity_by_altitude(self, random_model):
+        for layer in random_model.layers:
+            velocity_value = random_model.get_velocity_by_altitude(
+                altitude=layer.middle_altitude,
+            )
+            assert velocity_value == layer.vp
+
+        most_bottom_layer = random_model.layers[-1]
+        with pytest.raises(ValueError):
+            random_model.get_velocity_by_altitude(
+                altitude=most_bottom_layer.altitude_interval.min_val - 100,
+            )
+
+    @pytest.mark.parametrize(
+        'corner_picker',
+        [
+            _middle_middle_corners,
+            _top_middle_corners,
+            _middle_bottom_corners,
+            _top_bottom_corners,
+        ],
+    )
+    def test_get_interval_velocity_between(self, random_model, corner_picker):
+        layers = random_model.layers
+        for top_layer, bottom_layer in zip(layers, layers[1:]):
+            min_val, max_val, dh_top, dh_bottom = corner_picker(
+                top_layer, bottom_layer,
+            )
+            interval = Interval(min_val=min_val, max_val=max_val)
+            expected_velocity = (dh_top + dh_bottom) / (
+                dh_top / top_layer.vp + dh_bottom / bottom_layer.vp
+            )
+            velocity_value = random_model.get_interval_velocity(
+                altitude_interval=interval,
+            )
+            assert velocity_value == pytest.approx(expected_velocity)
+
+    def test_get_interval_velocities(self, random_model):
+        layers = random_model.layers
+        min_altitudes = [x.middle_altitude for x in layers[1:]]
+        max_altitudes = [x.middle_altitude for x in layers[:-1]]
+        velocity_values = random_model.get_interval_velocities(
+            min_altitudes=np.array(min_altitudes),
+            max_altitudes=np.array(max_altitudes),
+        )
+        expected_velocities = [
+            random_model.get_interval_velocity(
+                altitude_interval=Interval(min_val=min_val, max_val=max_val),
+            )
+            for min_val, max_val in zip(min_altitudes, max_altitudes)
+        ]
+        is_equal = np.allclose(velocity_values, expected_velocities)
+        assert is_equal is True
+
+    def test_get_interval_velocity_bad_intervals(self, model_bundle):
+        _, model, min_altitude, max_altitude = model_bundle
+        bad_intervals = [
+            Interval(min_val=min_altitude - 100, max_val=max_altitude),
+            Interval(min_val=min_altitude, max_val=max_altitude + 100),
+            Interval(min_val=min_altitude - 100, max_val=max_altitude + 100),
+        ]
+        for bad_interval in bad_intervals:
+            with pytest.raises(ValueError):
+                model.get_interval_velocity(altitude_interval=bad_interval)
+
+    def test_get_interval_velocity_zero_intervals(self, random_model):
+        for layer in random_model.layers:
+            interval = Interval(
+                min_val=layer.middle_altitude,
+                max_val=layer.middle_altitude,
+            )
+            velocity_value = random_model.get_interval_velocity(
+                altitude_interval=interval,
+            )
+            assert velocity_value == layer.vp